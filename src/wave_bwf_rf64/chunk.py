@@ -54,7 +54,7 @@ while True:
         # do something with data
 
 The interface is file-like.  The implemented methods are:
-read, close, seek, tell, isatty.
+read, readinto, close, seek, tell, isatty.
 Extra methods are: skip() (called by close, skips to the end of the chunk),
 getname() (returns the name (ID) of the chunk)
 
@@ -171,6 +171,33 @@ class Chunk:
             self.size_read = self.size_read + len(dummy)
         return data
 
+    def readinto(self, b):
+        """Read bytes into a pre-allocated, writable bytes-like object b.
+
+        Return the number of bytes read, which is never more than what
+        is left of the chunk.
+        """
+
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        if self.size_read >= self.chunksize:
+            return 0
+        view = memoryview(b).cast('B')
+        size = min(len(view), self.chunksize - self.size_read)
+        if hasattr(self.file, 'readinto'):
+            n = self.file.readinto(view[:size]) or 0
+        else:
+            data = self.file.read(size)
+            n = len(data)
+            view[:n] = data
+        self.size_read = self.size_read + n
+        if self.size_read == self.chunksize and \
+           self.align and \
+           (self.chunksize & 1):
+            dummy = self.file.read(1)
+            self.size_read = self.size_read + len(dummy)
+        return n
+
     def skip(self):
         """Skip the rest of the chunk.
 
@@ -193,7 +220,7 @@ class Chunk:
             except IOError:
                 pass
         while self.size_read < self.chunksize:
-            n = min(8192, self.chunksize - self.size_read)
+            n = min(65536, self.chunksize - self.size_read)
             dummy = self.read(n)
             if not dummy:
                 raise EOFError
@@ -41,6 +41,9 @@ This returns an instance of a class with the following public methods:
       getmark(id)     -- raises an error since the mark does not
                          exist (for compatibility with the aifc module)
       readframes(n)   -- returns at most n frames of audio
+      readframesinto(b)
+                      -- reads frames of audio into the writable buffer b
+                         and returns the number of frames read
       rewind()        -- rewind to the beginning of the audio stream
       setpos(pos)     -- seek to the specified position
       tell()          -- return the current position
@@ -73,7 +76,10 @@ Writing WAVE files:
       f = wave.open(file, 'w')
 where file is either the name of a file or an open file pointer.
 The open file pointer must have methods write(), tell(), seek(), and
-close().
+close().  An unbuffered (raw) file is given a write buffer of its own,
+which is flushed and detached again by close().
+      f = wave.open(file, 'w', patch_on_every_write=True)
+also patches up the file header after every writeframes() call.
 
 This returns an instance of a class with the following public methods:
       setnchannels(n) -- set the number of channels
@@ -90,7 +96,8 @@ This returns an instance of a class with the following public methods:
                       -- write audio frames without pathing up the
                          file header
       writeframes(data)
-                      -- write audio frames and patch up the file header
+                      -- write audio frames, and patch up the file header
+                         if patch_on_every_write was given
       close()         -- patch up the file header and close the
                          output file
 
@@ -101,7 +108,7 @@ bext chunk methods:
       set_bext_origination_date(tuple)      -- set origination date ([year, month, day])
       set_bext_origination_time(tuple)      -- set origination date ([hours, minutes, seconds])
       set_bext_time_reference(tuple)        -- set time reference ([high, low])
-      set_bext_umid(tuple)                  -- set UMID (list of 64 chars)
+      set_bext_umid(data)                   -- set UMID (64 bytes or list of 64 chars)
       set_bext_loudness_value(n)            -- set loudness value (float)
       set_bext_loudness_range(n)            -- set loudness range (float)
       set_bext_max_true_peak_level(n)       -- set max true peak level (float)
@@ -116,8 +123,10 @@ but when it is set to the correct value, the header does not have to
 be patched up.
 It is best to first set all parameters, perhaps possibly the
 compression type, and then write audio frames using writeframesraw.
-When all frames have been written, either call writeframes('') or
-close() to patch up the sizes in the header.
+When all frames have been written, call close() to patch up the sizes
+in the header.  Pass patch_on_every_write=True to open() to have
+writeframes() patch them up after every call as well, for instance when
+the file is read while it is being written.
 The close() method is called automatically when the class instance
 is destroyed.
 """
@@ -127,10 +136,12 @@ import builtins
 
 __all__ = ["open", "openfp", "Error", "R64mMarker"]
 
+import array
+import codecs
 import dataclasses
 import enum
-import typing
-import audioop
+import io
+import os
 import struct
 import sys
 
@@ -149,8 +160,91 @@ WAVE_FORMAT_PCM = 0x0001
 WAVE_FORMAT_MPEG = 0x0050
 WAVE_FORMAT_EXTENSIBLE = 0xFFFE
 
-_array_fmts = None, 'b', 'h', None, 'l'
+_array_fmts = None, 'b', 'h', None, 'i'
 
+# Buffer size used when an unbuffered file is passed to Wave_write
+_WRITE_BUFFER_SIZE = 1 << 20
+# Chunks up to this size are written together with their header
+_JOIN_LIMIT = 1 << 16
+# Data lengths above this are written as RF64. The signed 32-bit chunk sizes
+# top out at 2147483647; the rest is left for the other chunks in the file.
+_RF64_THRESHOLD = 2147483647 - 7000000
+
+
+def _file_descriptor(file):
+    """Return the file descriptor of a regular file object, else None.
+
+    Only plain files, buffered or not, are trusted to write straight to
+    their file descriptor; wrappers like gzip.GzipFile have one too.
+    """
+    if not hasattr(os, 'pwrite'):
+        return None
+    if isinstance(file, (io.BufferedWriter, io.BufferedRandom)):
+        file = file.raw
+    if isinstance(file, io.FileIO):
+        return file.fileno()
+    return None
+
+
+def _padded_size(data):
+    """Return the size of data once padded to an even number of bytes."""
+    return len(data) + (len(data) & 1)
+
+
+def _byteswap(data, sampwidth):
+    """Return a byteswapped copy of data as a writable bytes-like object.
+
+    Sample widths 2 and 4 give an array.array, 3 gives a bytearray; use
+    memoryview(...).nbytes rather than len() for the size in bytes.
+    """
+    if sampwidth == 3:
+        # There is no 24-bit array type, so swap the outer bytes of each sample
+        view = memoryview(data).cast('B')
+        swapped = bytearray(view)
+        swapped[0::3] = view[2::3]
+        swapped[2::3] = view[0::3]
+        return swapped
+    samples = array.array(_array_fmts[sampwidth])
+    samples.frombytes(data)
+    samples.byteswap()
+    return samples
+
+
+def _byteswap_into(buffer, sampwidth):
+    """Replace the samples in a writable buffer with their byteswapped copy."""
+    # Python cannot swap a foreign buffer in place without strided slice
+    # copies, which are much slower than swapping a copy and copying it back
+    view = memoryview(buffer).cast('B')
+    view[:] = memoryview(_byteswap(view, sampwidth)).cast('B')
+
+
+_FMT_CHUNK = struct.Struct('<Hhllh')
+_FMT_PCM = struct.Struct('<h')
+_FMT_EXTENSIBLE = struct.Struct('<hh')
+_FMT_EXTENSION = struct.Struct('<hLLLLL')
+_DS64_CHUNK = struct.Struct('<qqql')
+
+# Layouts used when writing, including the chunk ID and size
+_RIFF_HEADER = struct.Struct('<4sL4s')
+_CHUNK_HEADER = struct.Struct('<4sl')
+_CHUNK_SIZE = struct.Struct('<l')
+_DS64_CHUNK_HEADER = struct.Struct('<4slqqql')
+_FMT_CHUNK_HEADER = struct.Struct('<4slhhllhh')
+_MD5_CHUNK = struct.Struct('>16s')
+
+# Fixed-size part of the bext chunk, up to and including the reserved bytes.
+# Version 1 leaves the loudness fields zeroed as part of the reserved area.
+_BEXT_V1 = struct.Struct('<256s32s32s10s8sllh64s190s')
+_BEXT_V2 = struct.Struct('<256s32s32s10s8sllh64s5h180s')
+_BEXT_LOUDNESS_POS = 412
+_BEXT_LOUDNESS = struct.Struct('<5h')
+
+_CHNA_HEADER = struct.Struct('<hh')
+# track_idx, track_uid, track_ref, pack_ref and a padding byte
+_CHNA_ENTRY = struct.Struct('<H12s14s11sc')
+
+# Channel modes used in the coding history, as named by EBU R98-1999
+_CHANNEL_MODES = {1: 'mono', 2: 'stereo'}
 
 _wave_params = namedtuple('_wave_params',
                           'nchannels sampwidth framerate nframes comptype compname')
@@ -166,88 +260,61 @@ class Bext:
         self._origination_time = [now.hour, now.minute, now.second]
         self._time_reference = [0, 0]
         self._version = 1
-        self._umid = [b'\0']*64
+        self._umid = b'\0' * 64
         self._loudness_value = 0x7fff
         self._loudness_range = 0x7fff
         self._max_true_peak_level = 0x7fff
         self._max_momentary_loudness = 0x7fff
         self._max_short_term_loudness = 0x7fff
         self._coding_history = b''
-        self._loudness_params_pos = 344
+        self._loudness_params_pos = _BEXT_LOUDNESS_POS
+        # Set when loudness changes after the chunk was packed
+        self._loudness_dirty = False
 
     def pack_chunk(self):
-        chunk = struct.pack('<0256s', self._description)
-        chunk += struct.pack('<032s', self._originator)
-        chunk += struct.pack('<032s', self._originator_reference)
-        chunk += struct.pack('<04s', ('{0:04d}'.format(
-            self._origination_date[0]).encode('utf-8')))
-        chunk += b'-'
-        chunk += struct.pack('<02s', ('{0:02d}'.format(
-            self._origination_date[1]).encode('utf-8')))
-        chunk += b'-'
-        chunk += struct.pack('<02s', ('{0:02d}'.format(
-            self._origination_date[2]).encode('utf-8')))
-        chunk += struct.pack('<02s', ('{0:02d}'.format(
-            self._origination_time[0]).encode('utf-8')))
-        chunk += b'-'
-        chunk += struct.pack('<02s', ('{0:02d}'.format(
-            self._origination_time[1]).encode('utf-8')))
-        chunk += b'-'
-        chunk += struct.pack('<02s', ('{0:02d}'.format(
-            self._origination_time[2]).encode('utf-8')))
-        chunk += struct.pack('<ll', self._time_reference[0], self._time_reference[1])
-        chunk += struct.pack('<h', self._version)
-        for i in range(0, 64):
-            chunk += struct.pack('<c', self._umid[i])
-        self._loudness_params_pos = len(chunk)
+        date_time = '{0:04d}-{1:02d}-{2:02d}{3:02d}-{4:02d}-{5:02d}'.format(
+            *self._origination_date, *self._origination_time).encode('utf-8')
+        coding_history_size = len(self._coding_history)
+        chunk = bytearray(_BEXT_V2.size + coding_history_size + (coding_history_size & 1))
         if self._version >= 2:
-            chunk += struct.pack('<h', self._loudness_value)
-            chunk += struct.pack('<h', self._loudness_range)
-            chunk += struct.pack('<h', self._max_true_peak_level)
-            chunk += struct.pack('<h', self._max_momentary_loudness)
-            chunk += struct.pack('<h', self._max_short_term_loudness)
+            _BEXT_V2.pack_into(chunk, 0, self._description, self._originator,
+                               self._originator_reference, date_time[:10], date_time[10:],
+                               self._time_reference[0], self._time_reference[1],
+                               self._version, self._umid,
+                               self._loudness_value, self._loudness_range,
+                               self._max_true_peak_level, self._max_momentary_loudness,
+                               self._max_short_term_loudness, b'')
         else:
-            for i in range(0, 10):
-                chunk += b'\0'
-        for i in range(0, 180):
-            chunk += b'\0'
-        chunk += self._coding_history
-        if (len(self._coding_history) % 2) == 1:
-            chunk += b'\0'
-        return chunk
+            _BEXT_V1.pack_into(chunk, 0, self._description, self._originator,
+                               self._originator_reference, date_time[:10], date_time[10:],
+                               self._time_reference[0], self._time_reference[1],
+                               self._version, self._umid, b'')
+        chunk[_BEXT_V2.size:_BEXT_V2.size + coding_history_size] = self._coding_history
+        return bytes(chunk)
 
     def unpack_chunk(self, chunk):
         chunk.seek(0, 0)
-        self._description = struct.unpack('<0256s', chunk.read(256))[0]
-        self._originator = struct.unpack('<032s', chunk.read(32))[0]
-        self._originator_reference = struct.unpack('<032s', chunk.read(32))[0]
-        self._origination_date[0] = int(struct.unpack('<04s', chunk.read(4))[0])
-        chunk.read(1)
-        self._origination_date[1] = int(struct.unpack('<02s', chunk.read(2))[0])
-        chunk.read(1)
-        self._origination_date[2] = int(struct.unpack('<02s', chunk.read(2))[0])
-        self._origination_time[0] = int(struct.unpack('<02s', chunk.read(2))[0])
-        chunk.read(1)
-        self._origination_time[1] = int(struct.unpack('<02s', chunk.read(2))[0])
-        chunk.read(1)
-        self._origination_time[2] = int(struct.unpack('<02s', chunk.read(2))[0])
-        self._time_reference[0], self._time_reference[1] = struct.unpack('<ll', chunk.read(8))
-        self._version = struct.unpack('<h', chunk.read(2))[0]
-
-        for i in range(0, 64):
-            self._umid[i] = struct.unpack('<c', chunk.read(1))[0]
+        data = chunk.read(-1)
+        (self._description, self._originator, self._originator_reference, date, time,
+         self._time_reference[0], self._time_reference[1], self._version, self._umid,
+         loudness_value, loudness_range, max_true_peak_level, max_momentary_loudness,
+         max_short_term_loudness, _) = _BEXT_V2.unpack_from(data)
+        self._origination_date[0] = int(date[0:4])
+        self._origination_date[1] = int(date[5:7])
+        self._origination_date[2] = int(date[8:10])
+        self._origination_time[0] = int(time[0:2])
+        self._origination_time[1] = int(time[3:5])
+        self._origination_time[2] = int(time[6:8])
         if self._version >= 2:
-            self._loudness_value = struct.unpack('<h', chunk.read(2))[0]
-            self._loudness_range = struct.unpack('<h', chunk.read(2))[0]
-            self._max_true_peak_level = struct.unpack('<h', chunk.read(2))[0]
-            self._max_momentary_loudness = struct.unpack('<h', chunk.read(2))[0]
-            self._max_short_term_loudness = struct.unpack('<h', chunk.read(2))[0]
-        else:
-            chunk.read(10)
-        chunk.read(180)
-        self._coding_history = chunk.read(-1)
-
-    def scaleup(self, val):
+            self._loudness_value = loudness_value
+            self._loudness_range = loudness_range
+            self._max_true_peak_level = max_true_peak_level
+            self._max_momentary_loudness = max_momentary_loudness
+            self._max_short_term_loudness = max_short_term_loudness
+        self._coding_history = data[_BEXT_V2.size:]
+
+    @staticmethod
+    def scaleup(val):
         x = 0
         if val >= 0.0 and val < 100.0:
             x = int((100.0 * val) + 0.5)
@@ -257,7 +324,8 @@ class Bext:
             x = 0x7fff
         return x
 
-    def scaledown(self, val):
+    @staticmethod
+    def scaledown(val):
         x = None
         if val != 0x7fff:
             x = float(val) / 100.0
@@ -265,14 +333,10 @@ class Bext:
 
     def generate_coding_history(self, framerate, sampwidth, nchannels):
         """The format of the coding_history is based on EBU R98-1999"""
-        if nchannels == 1:
-            chnstr = b'mono'
-        elif nchannels == 2:
-            chnstr = b'stereo'
-        else:
-            chnstr = b'%d' % (nchannels)
-        self._coding_history = b'A=PCM,F=%u,W=%hu,M=%s,T=%s-%s\r\n' % (
-            framerate, sampwidth * 8, chnstr, b'wave_bwf_levl_RF64.py', b'1.0.6')
+        chnstr = _CHANNEL_MODES.get(nchannels) or str(nchannels)
+        self._coding_history = (
+            f'A=PCM,F={framerate},W={sampwidth * 8},M={chnstr},'
+            f'T=wave_bwf_levl_RF64.py-1.0.6\r\n').encode('ascii')
         if (len(self._coding_history) % 2) == 1:
             self._coding_history += b'\0'
 
@@ -280,15 +344,14 @@ class Bext:
         return self._loudness_params_pos
 
     def rewrite_loudness_parameters(self):
-        chunk = struct.pack('<h', self._loudness_value)
-        chunk += struct.pack('<h', self._loudness_range)
-        chunk += struct.pack('<h', self._max_true_peak_level)
-        chunk += struct.pack('<h', self._max_momentary_loudness)
-        chunk += struct.pack('<h', self._max_short_term_loudness)
-        return chunk
+        return _BEXT_LOUDNESS.pack(self._loudness_value, self._loudness_range,
+                                   self._max_true_peak_level, self._max_momentary_loudness,
+                                   self._max_short_term_loudness)
 
 
 class Chna:
+    _padding = memoryview(bytes(_CHNA_ENTRY.size * 2048))
+
     def __init__(self):
         self._num_tracks = 0
         self._num_uids = 0
@@ -323,39 +386,26 @@ class Chna:
         return self._ch_id[num]
 
     def pack_chunk(self):
-        chunk = struct.pack('<h', self._num_tracks)
-        chunk += struct.pack('<h', self._num_uids)
-        for i in range(self._num_uids):
-            chunk += struct.pack('<H', (self._ch_id[i][0]))      # track_idx
-            chunk += struct.pack('<012s', (self._ch_id[i][1]))   # track_uid
-            chunk += struct.pack('<014s', (self._ch_id[i][2]))   # track_ref
-            chunk += struct.pack('<011s', (self._ch_id[i][3]))   # pack_ref
-            chunk += struct.pack('<c', '\0')                     # padding
         if self._num_uids < 32:
             ex_uids = 32
         else:
             ex_uids = 2048
-        for i in range(ex_uids - self._num_uids):
-            chunk += struct.pack('<H', 0)      # track_idx
-            chunk += struct.pack('<012s', '\0')   # track_uid
-            chunk += struct.pack('<014s', '\0')   # track_ref
-            chunk += struct.pack('<011s', '\0')   # pack_ref
-            chunk += struct.pack('<c', '\0')    # padding
-        return chunk
+        chunk = bytearray(_CHNA_HEADER.size + _CHNA_ENTRY.size * self._num_uids)
+        _CHNA_HEADER.pack_into(chunk, 0, self._num_tracks, self._num_uids)
+        offset = _CHNA_HEADER.size
+        for track_idx, track_uid, track_ref, pack_ref in self._ch_id:
+            _CHNA_ENTRY.pack_into(chunk, offset, track_idx, track_uid, track_ref, pack_ref, b'\0')
+            offset += _CHNA_ENTRY.size
+        # Unused entries are copied straight from the shared block of zeros
+        padding = self._padding[:_CHNA_ENTRY.size * max(ex_uids - self._num_uids, 0)]
+        return b''.join((chunk, padding))
 
     def unpack_chunk(self, chunk):
         chunk.seek(0, 0)
-        self._num_tracks = struct.unpack('<h', chunk.read(2))[0]
-        self._num_uids = struct.unpack('<h', chunk.read(2))[0]
-        self._ch_id = []
-        for i in range(self._num_uids):
-            ch_id = []
-            ch_id.append(struct.unpack('<H', chunk.read(2))[0])       # track_idx
-            ch_id.append(struct.unpack('<012s', chunk.read(12))[0])   # track_uid
-            ch_id.append(struct.unpack('<014s', chunk.read(14))[0])   # track_ref
-            ch_id.append(struct.unpack('<011s', chunk.read(11))[0])   # pack_ref
-            chunk.read(1)                   # padding
-            self._ch_id.append(ch_id)
+        self._num_tracks, self._num_uids = _CHNA_HEADER.unpack(chunk.read(_CHNA_HEADER.size))
+        data = chunk.read(_CHNA_ENTRY.size * self._num_uids)
+        # Each entry is [track_idx, track_uid, track_ref, pack_ref], dropping the padding
+        self._ch_id = [list(entry[:4]) for entry in _CHNA_ENTRY.iter_unpack(data)]
 
 
 @dataclasses.dataclass
@@ -365,20 +415,6 @@ class R64mMarker:
     label: str
 
 
-class RawR64mMarkerEntry(typing.NamedTuple):
-    flags: int
-    sample_offset: int
-    byte_offset: int
-    intra_sample_offset: int
-    label_text: bytes
-    label_chunk_identifier: int
-    vendor_and_product: bytes
-    user_data_1: int
-    user_data_2: int
-    user_data_3: int
-    user_data_4: int
-
-
 class MarkerEntryFlags(enum.Flag):
     ENTRY_IS_VALID = enum.auto()
     BYTE_OFFSET_IS_VALID = enum.auto()
@@ -387,6 +423,20 @@ class MarkerEntryFlags(enum.Flag):
     LABEL_TEXT_IS_UTF_8 = enum.auto()
 
 
+_ENTRY_IS_VALID = MarkerEntryFlags.ENTRY_IS_VALID.value
+_LABEL_TEXT_IS_UTF_8 = MarkerEntryFlags.LABEL_TEXT_IS_UTF_8.value
+_decode_utf_8 = codecs.getdecoder("utf-8")
+_decode_windows_1252 = codecs.getdecoder("windows-1252")
+
+# Marker entry: flags, sample offset, byte offset, intra-sample offset,
+# label text, label chunk identifier, vendor and product, user data 1-4.
+# The label text is skipped when unpacking, so it can be decoded from the
+# chunk data without copying it first
+_R64M_ENTRY = struct.Struct("<L Q Q Q 256x L 16s 4L")
+_R64M_LABEL_OFFSET = 28
+_R64M_LABEL_SIZE = 256
+
+
 class R64m:
     def __init__(self):
         self._markers: list[R64mMarker] = []
@@ -396,25 +446,27 @@ class R64m:
 
     def unpack_chunk(self, chunk: Chunk, sample_rate: int):
         chunk.seek(0, 0)
-        chunk_size = chunk.getsize()
-        while chunk.tell() < chunk_size:
-            raw_values = struct.unpack("<L Q Q Q 256s L 16s 4L", chunk.read(320))
-            marker_entry = RawR64mMarkerEntry._make(raw_values)
-
-            flags = MarkerEntryFlags(marker_entry.flags)
-            if MarkerEntryFlags.ENTRY_IS_VALID not in flags:
+        data = chunk.read(chunk.getsize())
+        view = memoryview(data)
+        timedelta = datetime.timedelta
+        for offset in range(0, len(data) - _R64M_ENTRY.size + 1, _R64M_ENTRY.size):
+            raw_values = _R64M_ENTRY.unpack_from(data, offset)
+            flags = raw_values[0]
+            if not flags & _ENTRY_IS_VALID:
                 continue
 
-            sample_offset = marker_entry.sample_offset
-            seconds_offset = sample_offset / sample_rate
-            time_offset = datetime.timedelta(seconds=seconds_offset)
+            sample_offset = raw_values[1]
+            time_offset = timedelta(seconds=sample_offset / sample_rate)
 
-            if MarkerEntryFlags.LABEL_TEXT_IS_UTF_8 in flags:
-                encoding = "utf-8"
+            if flags & _LABEL_TEXT_IS_UTF_8:
+                decode = _decode_utf_8
             else:
-                encoding = "windows-1252"
-            label_until_null = marker_entry.label_text.rstrip(b'\x00')
-            label = label_until_null.decode(encoding)
+                decode = _decode_windows_1252
+            label_start = offset + _R64M_LABEL_OFFSET
+            label_end = data.find(b'\x00', label_start, label_start + _R64M_LABEL_SIZE)
+            if label_end < 0:
+                label_end = label_start + _R64M_LABEL_SIZE
+            label = decode(view[label_start:label_end])[0]
             self._markers.append(R64mMarker(sample_offset, time_offset, label))
 
 
@@ -449,6 +501,16 @@ class Wave_read:
     _framesize -- size of one frame in the file
     """
 
+    # Chunks which are only kept for later, by the attribute they are kept in
+    _chunk_attributes = {
+        b'bext': '_bext_chunk',
+        b'axml': '_axml_chunk',
+        b'MD5 ': '_md5_chunk',
+        b'levl': '_levl_chunk',
+        b'chna': '_chna_chunk',
+        b'r64m': '_r64m_chunk',
+    }
+
     def initfp(self, file):
         self._convert = None
         self._soundpos = 0
@@ -503,18 +565,10 @@ class Wave_read:
                 self._nframes = chunk.chunksize // self._framesize  # ** Chunksize may be FFFFFFFF read real length from separate chunk
                 self._data_seek_needed = 0
                 # break
-            elif chunkname == b'bext':
-                self._bext_chunk = chunk
-            elif chunkname == b'axml':
-                self._axml_chunk = chunk
-            elif chunkname == b'MD5 ':
-                self._md5_chunk = chunk
-            elif chunkname == b'levl':
-                self._levl_chunk = chunk
-            elif chunkname == b'chna':
-                self._chna_chunk = chunk
-            elif chunkname == b'r64m':
-                self._r64m_chunk = chunk
+            else:
+                attribute = self._chunk_attributes.get(chunkname)
+                if attribute is not None:
+                    setattr(self, attribute, chunk)
             chunk.skip()
         if not self._fmt_chunk_read or not self._data_chunk:
             raise Error('fmt chunk and/or data chunk missing')
@@ -590,38 +644,35 @@ class Wave_read:
 
     def readframes(self, nframes):
         if self._data_seek_needed:
-            self._data_chunk.seek(0, 0)
-            pos = self._soundpos * self._framesize
-            if pos:
-                self._data_chunk.seek(pos, 0)
-            self._data_seek_needed = 0
+            self._seek_data()
         if nframes == 0:
             return b''
         data = self._data_chunk.read(nframes * self._framesize)
         if self._sampwidth != 1 and sys.byteorder == 'big':
-            data = audioop.byteswap(data, self._sampwidth)
-            # # unfortunately the fromfile() method does not take
-            # # something that only looks like a file object, so
-            # # we have to reach into the innards of the chunk object
-            # import array
-            # chunk = self._data_chunk
-            # data = array.array(_array_fmts[self._sampwidth])
-            # nitems = nframes * self._nchannels
-            # if nitems * self._sampwidth > chunk.chunksize - chunk.size_read:
-            #     nitems = (chunk.chunksize - chunk.size_read) / self._sampwidth
-            # data.fromfile(chunk.file.file, nitems)
-            # # "tell" data chunk how much was read
-            # chunk.size_read = chunk.size_read + nitems * self._sampwidth
-            # # do the same for the outermost chunk
-            # chunk = chunk.file
-            # chunk.size_read = chunk.size_read + nitems * self._sampwidth
-            # data.byteswap()
-            # data = data.tostring()
+            data = bytes(_byteswap(data, self._sampwidth))
         if self._convert and data:
             data = self._convert(data)
         self._soundpos = self._soundpos + len(data) // (self._nchannels * self._sampwidth)
         return data
 
+    def readframesinto(self, buffer):
+        """Read as many whole frames as fit into buffer.
+
+        The buffer may be any writable bytes-like object and is reused
+        as-is, so no new bytes object is allocated per call.  Return the
+        number of frames read.
+        """
+        if self._data_seek_needed:
+            self._seek_data()
+        view = memoryview(buffer).cast('B')
+        view = view[:len(view) - len(view) % self._framesize]
+        nbytes = self._data_chunk.readinto(view)
+        if self._sampwidth != 1 and sys.byteorder == 'big':
+            _byteswap_into(view[:nbytes], self._sampwidth)
+        nframes = nbytes // self._framesize
+        self._soundpos = self._soundpos + nframes
+        return nframes
+
     def read_bext(self):
         if not self._bext_chunk:
             return False
@@ -647,7 +698,9 @@ class Wave_read:
         return self._bext._time_reference
 
     def get_bext_umid(self):
-        return self._bext._umid
+        # Kept as a list of single bytes for backwards compatibility
+        umid = self._bext._umid
+        return [umid[i:i + 1] for i in range(len(umid))]
 
     def get_bext_version(self):
         return self._bext._version
@@ -726,18 +779,24 @@ class Wave_read:
     # Internal methods.
     #
 
+    def _seek_data(self):
+        self._data_chunk.seek(0, 0)
+        pos = self._soundpos * self._framesize
+        if pos:
+            self._data_chunk.seek(pos, 0)
+        self._data_seek_needed = 0
+
     def _read_fmt_chunk(self, chunk):
-        wFormatTag, self._nchannels, self._framerate, dwAvgBytesPerSec, wBlockAlign = struct.unpack('<Hhllh', chunk.read(14))
+        wFormatTag, self._nchannels, self._framerate, dwAvgBytesPerSec, wBlockAlign = _FMT_CHUNK.unpack(chunk.read(_FMT_CHUNK.size))
         if wFormatTag == WAVE_FORMAT_PCM:
-            sampwidth = struct.unpack('<h', chunk.read(2))[0]
+            sampwidth, = _FMT_PCM.unpack(chunk.read(_FMT_PCM.size))
             self._sampwidth = (sampwidth + 7) // 8
         elif wFormatTag == WAVE_FORMAT_EXTENSIBLE:
-            sampwidth, cbSize = struct.unpack('<hh', chunk.read(4))
+            sampwidth, cbSize = _FMT_EXTENSIBLE.unpack(chunk.read(_FMT_EXTENSIBLE.size))
             self._sampwidth = (sampwidth + 7) // 8
             if cbSize != 22:
                 raise Error('WAVE_FORMAT_EXTENSIBLE format, wrong cbSize: %r' % (cbSize))
-            subFormat = [0, 0, 0, 0]
-            wValidBitsPerSample, dwChannelMask, subFormat[0], subFormat[1], subFormat[2], subFormat[3] = struct.unpack('<hLLLLL', chunk.read(22))
+            wValidBitsPerSample, dwChannelMask, *subFormat = _FMT_EXTENSION.unpack(chunk.read(_FMT_EXTENSION.size))
         else:
             raise Error('unknown format: %r' % (wFormatTag,))
         self._framesize = self._nchannels * self._sampwidth
@@ -746,7 +805,7 @@ class Wave_read:
 
 
     def _read_ds64_chunk(self, chunk):
-        self._riffSize, self.dataSize, self.sampleCount, self._tableLength = struct.unpack('<qqql', chunk.read(28))
+        self._riffSize, self.dataSize, self.sampleCount, self._tableLength = _DS64_CHUNK.unpack(chunk.read(_DS64_CHUNK.size))
 
 
 class Wave_write:
@@ -775,8 +834,9 @@ class Wave_write:
     _datawritten -- the size of the audio samples actually written
     """
 
-    def __init__(self, f):
+    def __init__(self, f, patch_on_every_write=False):
         self._i_opened_the_file = None
+        self._patch_on_every_write = patch_on_every_write
         if isinstance(f, str):
             f = builtins.open(f, 'wb')
             self._i_opened_the_file = f
@@ -788,7 +848,14 @@ class Wave_write:
             raise
 
     def initfp(self, file):
+        # Unbuffered files would turn every small header write into a system
+        # call, so put a buffer in front of them.  It is detached again on
+        # close, leaving the file itself open for the caller.
+        self._detach_file = isinstance(file, io.RawIOBase)
+        if self._detach_file:
+            file = io.BufferedWriter(file, buffer_size=_WRITE_BUFFER_SIZE)
         self._file = file
+        self._fd = _file_descriptor(file)
         self._convert = None
         self._nchannels = 0
         self._sampwidth = 0
@@ -797,16 +864,20 @@ class Wave_write:
         self._nframeswritten = 0
         self._datawritten = 0
         self._datalength = 0
+        self._write_pos = 0
+        self._swap_buf = None
 
         self._bext_chunk_data = None
         self._axml_chunk_data = None
         self._md5_chunk_data = None
         self._levl_chunk_data = None
         self._chna_chunk_data = None
+        self._extra_chunks_size = 0
         self._bext = Bext()
         self._chna = Chna()
 
         self._headerwritten = False
+        self._bytes_per_frame = 0
 
     def __del__(self):
         self.close()
@@ -821,7 +892,8 @@ class Wave_write:
     # User visible methods.
     #
     def setnchannels(self, nchannels):
-        if self._datawritten:
+        # Fixed by the header, which writeframes(b'') writes as well
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
         if nchannels < 1:
             raise Error('bad # of channels')
@@ -833,7 +905,7 @@ class Wave_write:
         return self._nchannels
 
     def setsampwidth(self, sampwidth):
-        if self._datawritten:
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
         if sampwidth < 1 or sampwidth > 4:
             raise Error('bad sample width')
@@ -845,7 +917,7 @@ class Wave_write:
         return self._sampwidth
 
     def setframerate(self, framerate):
-        if self._datawritten:
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
         if framerate <= 0:
             raise Error('bad frame rate')
@@ -857,7 +929,7 @@ class Wave_write:
         return self._framerate
 
     def setnframes(self, nframes):
-        if self._datawritten:
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
         self._nframes = nframes
 
@@ -865,7 +937,7 @@ class Wave_write:
         return self._nframeswritten
 
     def setcomptype(self, comptype, compname):
-        if self._datawritten:
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
         if comptype not in ('NONE',):
             raise Error('unsupported compression type')
@@ -880,13 +952,23 @@ class Wave_write:
 
     def setparams(self, params):
         nchannels, sampwidth, framerate, nframes, comptype, compname = params
-        if self._datawritten:
+        if self._headerwritten:
             raise Error('cannot change parameters after starting to write')
-        self.setnchannels(nchannels)
-        self.setsampwidth(sampwidth)
-        self.setframerate(framerate)
-        self.setnframes(nframes)
-        self.setcomptype(comptype, compname)
+        # Same checks as the individual setters, done before changing anything
+        if nchannels < 1:
+            raise Error('bad # of channels')
+        if sampwidth < 1 or sampwidth > 4:
+            raise Error('bad sample width')
+        if framerate <= 0:
+            raise Error('bad frame rate')
+        if comptype not in ('NONE',):
+            raise Error('unsupported compression type')
+        self._nchannels = nchannels
+        self._sampwidth = sampwidth
+        self._framerate = int(round(framerate))
+        self._nframes = nframes
+        self._comptype = comptype
+        self._compname = compname
 
     def getparams(self):
         if not self._nchannels or not self._sampwidth or not self._framerate:
@@ -907,40 +989,60 @@ class Wave_write:
         return self._nframeswritten
 
     def writeframesraw(self, data):
-        if not isinstance(data, (bytes, bytearray)):
-            data = memoryview(data).cast('B')
-        self._ensure_header_written(len(data))
-        nframes = len(data) // (self._sampwidth * self._nchannels)
-        if self._convert:
-            data = self._convert(data)
-
-        if self._sampwidth != 1 and sys.byteorder == 'big':
-            data = audioop.byteswap(data, self._sampwidth)
+        # Any bytes-like object is written as is, without converting it first
+        if isinstance(data, (bytes, bytearray)):
+            nbytes = len(data)
+        else:
+            nbytes = memoryview(data).nbytes
+        if not self._headerwritten:
+            self._ensure_header_written(nbytes)
+        nframes = nbytes // self._bytes_per_frame
+        convert = self._convert
+        if convert:
+            data = convert(data)
+            nbytes = len(data)
+
+        sampwidth = self._sampwidth
+        if sampwidth == 3 and sys.byteorder == 'big':
+            data = _byteswap(data, sampwidth)
+        elif sampwidth != 1 and sys.byteorder == 'big':
+            # Swap a copy in a reused array, leaving the caller's data untouched
+            swap_buf = self._swap_buf
+            if swap_buf is None or len(swap_buf) * sampwidth != nbytes:
+                swap_buf = self._swap_buf = array.array(_array_fmts[sampwidth], bytes(nbytes))
+            memoryview(swap_buf).cast('B')[:] = memoryview(data).cast('B')
+            swap_buf.byteswap()
+            data = swap_buf
 
         self._file.write(data)
-        self._datawritten += len(data)
-        self._nframeswritten = self._nframeswritten + nframes
+        self._write_pos += nbytes
+        self._datawritten += nbytes
+        self._nframeswritten += nframes
 
     def writeframes(self, data):
         self.writeframesraw(data)
-        if self._datalength != self._datawritten:
+        if self._patch_on_every_write and self._datalength != self._datawritten:
             self._patchheader()
 
     def close(self):
         try:
             if self._file:
                 self._ensure_header_written(0)
+                # The axml and levl data may have changed since they were set
+                self._update_extra_chunks_size()
                 # if self._datalength != self._datawritten:
                 self._patchheader()
-                if self._axml_chunk_data:
-                    self._write_axml_chunk()
-                if self._levl_chunk_data:
-                    self._write_levl_chunk()
-                if self._md5_chunk_data:
-                    self._write_md5_chunk()
+                # axml and levl are padded to an even size here, so the
+                # setters need not copy the data
+                parts = self._trailing_chunk_parts()
+                if parts:
+                    self._write_gathered(parts)
                 self._file.flush()
         finally:
+            buffered_file = self._file if self._detach_file else None
             self._file = None
+            if buffered_file is not None:
+                buffered_file.detach()
             file = self._i_opened_the_file
             if file:
                 self._i_opened_the_file = None
@@ -969,27 +1071,34 @@ class Wave_write:
         self._bext._time_reference = val
 
     def set_bext_umid(self, val):
+        if not isinstance(val, (bytes, bytearray)):
+            val = b''.join(val)
         self._bext._umid = val
 
     def set_bext_loudness_value(self, val):
         self._bext._loudness_value = self._bext.scaleup(val)
         self._bext._version = 2
+        self._bext._loudness_dirty = True
 
     def set_bext_loudness_range(self, val):
         self._bext._loudness_range = self._bext.scaleup(val)
         self._bext._version = 2
+        self._bext._loudness_dirty = True
 
     def set_bext_max_true_peak_level(self, val):
         self._bext._max_true_peak_level = self._bext.scaleup(val)
         self._bext._version = 2
+        self._bext._loudness_dirty = True
 
     def set_bext_max_momentary_loudness(self, val):
         self._bext._max_momentary_loudness = self._bext.scaleup(val)
         self._bext._version = 2
+        self._bext._loudness_dirty = True
 
     def set_bext_max_short_term_loudness(self, val):
         self._bext._max_short_term_loudness = self._bext.scaleup(val)
         self._bext._version = 2
+        self._bext._loudness_dirty = True
 
     def set_bext_coding_history(self, val):
         self._bext._coding_history = val
@@ -999,6 +1108,10 @@ class Wave_write:
             self._bext.generate_coding_history(self._framerate,
                                                self._sampwidth, self._nchannels)
         self._bext_chunk_data = self._bext.pack_chunk()
+        # Once the header is out, only the loudness patch reaches the file
+        if not self._headerwritten:
+            self._bext._loudness_dirty = False
+        self._update_extra_chunks_size()
 
     def update_bext_coding_history(self):
         """Update an existing bext coding history chunk with a new line."""
@@ -1014,21 +1127,23 @@ class Wave_write:
 
     def copy_bext(self, _bext_chunk):
         self._bext_chunk_data = _bext_chunk
+        self._update_extra_chunks_size()
 
     def set_axml(self, data):
         self._axml_chunk_data = data
-        if (len(self._axml_chunk_data) % 2) == 1:
-            self._axml_chunk_data += b' '
+        self._update_extra_chunks_size()
 
     def set_md5(self, data):
-        self._md5_chunk_data = data
-        if (len(self._md5_chunk_data) % 2) == 1:
-            self._md5_chunk_data += b' '
+        if (len(data) % 2) == 1:
+            # Padding a copy, as += would extend a caller's bytearray
+            data = bytes(data) + b' '
+        # Kept the way it is written: byte reversed and 16 bytes long
+        self._md5_chunk_data = _MD5_CHUNK.pack(data[::-1])
+        self._update_extra_chunks_size()
 
     def set_levl(self, data):
         self._levl_chunk_data = data
-        if (len(self._levl_chunk_data) % 2) == 1:
-            self._levl_chunk_data += b' '  # Don't know if this is needed
+        self._update_extra_chunks_size()
 
     def chna_add_new_track(self, track_idx, track_uid, track_ref, pack_ref):
         self._chna.add_new_track(track_idx, track_uid, track_ref, pack_ref)
@@ -1038,6 +1153,7 @@ class Wave_write:
 
     def set_chna(self):
         self._chna_chunk_data = self._chna.pack_chunk()
+        self._update_extra_chunks_size()
 
     #
     # Internal methods.
@@ -1053,6 +1169,7 @@ class Wave_write:
             if not self._framerate:
                 raise Error('sampling rate not specified')
 
+            self._bytes_per_frame = self._sampwidth * self._nchannels
             self._write_header(datasize)
             if self._bext_chunk_data:
                 self._write_bext_chunk()
@@ -1065,117 +1182,156 @@ class Wave_write:
         # *** MOD
         assert not self._headerwritten
         if not self._nframes:
-            self._nframes = initlength / (self._nchannels * self._sampwidth)
-        self._datalength = self._nframes * self._nchannels * self._sampwidth
+            self._nframes = initlength // self._bytes_per_frame
+        self._datalength = self._nframes * self._bytes_per_frame
 
         # RF64 territory
-        if self._datalength > 2140483647:  # eg 2147483647 - some space for other chunks
+        if self._datalength > _RF64_THRESHOLD:
             self._type = b'RF64'
-            self._file.write(b'RF64')
-            self._form_length_pos = self._file.tell()
-            self._file.write(struct.pack('<l', -1))
-            self._file.write(b'WAVE')
-            self._form_length_pos = self._file.tell()
-            self._write_ds64_header()
-            self._write_fmt()
+            header = b''.join((_RIFF_HEADER.pack(b'RF64', 0xFFFFFFFF, b'WAVE'),
+                               self._pack_ds64_chunk(), self._pack_fmt_chunk()))
         else:
             self._type = b'RIFF'
-            self._file.write(b'RIFF')
-            self._form_length_pos = self._file.tell()
-            self._file.write(struct.pack('<L4s',
-                                         36 + self._datalength, b'WAVE'))
-            self._write_fmt()
+            header = b''.join((_RIFF_HEADER.pack(b'RIFF', 36 + self._datalength, b'WAVE'),
+                               self._pack_fmt_chunk()))
+        # The RIFF size is patched for RIFF files, the ds64 chunk for RF64 files
+        # The only tell(); later positions are counted by _write()
+        self._write_pos = self._file.tell()
+        self._form_length_pos = self._write_pos + (
+            _RIFF_HEADER.size if self._type == b'RF64' else 4)
+        self._write(header)
 
         self._headerwritten = True
 
     # Add
-    def _write_ds64_header(self, new_size=None):
+    def _pack_ds64_chunk(self, new_size=None):
+        # Add 36 byte for ds64 header
         if not new_size:
-            self._file.write(struct.pack(
-                '<4slqqql', b'ds64', 28, self._datalength + 36 + 36,
-                self._datalength, self._nframes, 0))
+            return _DS64_CHUNK_HEADER.pack(
+                b'ds64', 28, self._datalength + 36 + 36,
+                self._datalength, self._nframes, 0)
         else:
-            self._file.write(struct.pack(
-                '<4slqqql', b'ds64', 28, new_size + 36,
-                self._datawritten, self._nframes, 0))
-
-            # Add 36 byte for ds64 header
+            return _DS64_CHUNK_HEADER.pack(
+                b'ds64', 28, new_size + 36,
+                self._datawritten, self._nframes, 0)
 
-    def _write_fmt(self):
-        self._file.write(struct.pack('<4slhhllhh',
-                                     b'fmt ', 16,
-                                     WAVE_FORMAT_PCM, self._nchannels, self._framerate,
-                                     self._nchannels * self._framerate * self._sampwidth,
-                                     self._nchannels * self._sampwidth,
-                                     self._sampwidth * 8))
+    def _pack_fmt_chunk(self):
+        return _FMT_CHUNK_HEADER.pack(b'fmt ', 16,
+                                      WAVE_FORMAT_PCM, self._nchannels, self._framerate,
+                                      self._nchannels * self._framerate * self._sampwidth,
+                                      self._nchannels * self._sampwidth,
+                                      self._sampwidth * 8)
 
     def _write_data_header(self):
-        self._file.write(struct.pack('<4s', b'data'))
-        self._data_length_pos = self._file.tell()
+        self._data_length_pos = self._write_pos + 4
         if self._type == b'RF64':
-            self._file.write(struct.pack('<l', -1))
+            self._write(_CHUNK_HEADER.pack(b'data', -1))
         else:
-            self._file.write(struct.pack('<l', self._datalength))
+            self._write(_CHUNK_HEADER.pack(b'data', self._datalength))
 
     def _patchheader(self):
         # if self._datawritten == self._datalength:
         #    return
         # Mask values before struct.pack & 0xFFFFFFFF
         assert self._headerwritten
-        curpos = self._file.tell()
-        self._file.seek(self._form_length_pos, 0)
-        new_size = 36                  # fmt chunk size
-        new_size += self._datawritten  # data chunk size
+        # fmt chunk, data chunk and all other chunks
+        new_size = 36 + self._datawritten + self._extra_chunks_size
+        if self._type == b'RF64':
+            patches = [(self._form_length_pos, self._pack_ds64_chunk(new_size))]
+        else:
+            patches = [(self._form_length_pos, _CHUNK_SIZE.pack(new_size)),
+                       (self._data_length_pos, _CHUNK_SIZE.pack(self._datawritten))]
+        # Loudness set after set_bext() is only known once the chunk is written
+        if self._bext_chunk_data and self._bext._loudness_dirty:
+            patches.append((self._loudness_params_pos, self._bext.rewrite_loudness_parameters()))
+            self._bext._loudness_dirty = False
+        self._write_at(patches)
+        self._datalength = self._datawritten
+
+    def _write(self, data):
+        self._file.write(data)
+        self._write_pos += len(data)
+
+    def _write_at(self, patches):
+        # Write each (position, data) pair, leaving the file position as it was
+        if self._fd is not None:
+            self._file.flush()
+            for pos, data in patches:
+                os.pwrite(self._fd, data, pos)
+        else:
+            for pos, data in patches:
+                self._file.seek(pos, 0)
+                self._file.write(data)
+            self._file.seek(self._write_pos, 0)
+
+    def _update_extra_chunks_size(self):
+        # Sizes of all chunks other than fmt and data, including their headers
+        size = 0
         if self._bext_chunk_data:           # bext chunk size
-            new_size += len(self._bext_chunk_data) + 8
+            size += len(self._bext_chunk_data) + 8
         if self._chna_chunk_data:           # chna chunk size
-            new_size += len(self._chna_chunk_data) + 8
+            size += len(self._chna_chunk_data) + 8
         if self._axml_chunk_data:           # axml chunk size
-            new_size += len(self._axml_chunk_data) + 8
+            size += _padded_size(self._axml_chunk_data) + 8
         if self._md5_chunk_data:           # md5  chunk size
-            new_size += len(self._md5_chunk_data) + 8
+            size += len(self._md5_chunk_data) + 8
         if self._levl_chunk_data:           # levl chunk size
-            new_size += len(self._levl_chunk_data) + 8
-        if self._type == b'RF64':
-            self._write_ds64_header(new_size)
-        else:
-            self._file.write(struct.pack('<l', new_size))
-            self._file.seek(self._data_length_pos, 0)
-            self._file.write(struct.pack('<l', self._datawritten))
-        if self._bext_chunk_data:
-            self._file.seek(self._loudness_params_pos, 0)
-            self._file.write(self._bext.rewrite_loudness_parameters())
-        self._file.seek(curpos, 0)
-        self._datalength = self._datawritten
+            size += _padded_size(self._levl_chunk_data) + 8
+        self._extra_chunks_size = size
+
+    def _write_gathered(self, parts):
+        # Write the buffers at the current position, in one system call if possible
+        if self._fd is None or not hasattr(os, 'writev'):
+            for part in parts:
+                self._write(part)
+            return
+        self._file.flush()
+        size = sum(map(len, parts))
+        written = os.writev(self._fd, parts)
+        if written < size:
+            rest = memoryview(b''.join(parts))[written:]
+            while rest:
+                rest = rest[os.write(self._fd, rest):]
+        self._write_pos += size
+        # Bring the file object up to date with the file descriptor
+        self._file.seek(self._write_pos, 0)
+
+    @staticmethod
+    def _chunk_parts(chunkname, data, padding=b''):
+        # The padding, if any, is counted in the chunk size
+        header = _CHUNK_HEADER.pack(chunkname, len(data) + len(padding))
+        if len(data) <= _JOIN_LIMIT:
+            return [b''.join((header, data, padding))]
+        # Copying large payloads costs more than the extra writes
+        return [header, data, padding] if padding else [header, data]
+
+    def _write_chunk(self, chunkname, data, padding=b''):
+        for part in self._chunk_parts(chunkname, data, padding):
+            self._write(part)
 
     def _write_bext_chunk(self):
-        self._file.write(struct.pack('<4s', b'bext'))
-        self._file.write(struct.pack('<l', len(self._bext_chunk_data)))
-        self._loudness_params_pos = self._bext.loudness_params_pos() + self._file.tell()
-        self._file.write(self._bext_chunk_data)
-
-    def _write_axml_chunk(self):
-        self._file.write(struct.pack('<4s', b'axml'))
-        self._file.write(struct.pack('<l', len(self._axml_chunk_data)))
-        self._file.write(self._axml_chunk_data)
-
-    def _write_md5_chunk(self):
-        self._file.write(struct.pack('<4s', b'MD5 '))
-        self._file.write(struct.pack('<l', 16))
-        self._file.write(struct.pack('>16s', self._md5_chunk_data[::-1]))
-
-    def _write_levl_chunk(self):
-        self._file.write(struct.pack('<4s', b'levl'))
-        self._file.write(struct.pack('<l', len(self._levl_chunk_data)))
-        self._file.write(self._levl_chunk_data)
+        self._loudness_params_pos = (self._write_pos + _CHUNK_HEADER.size
+                                     + self._bext.loudness_params_pos())
+        self._write_chunk(b'bext', self._bext_chunk_data)
+
+    def _trailing_chunk_parts(self):
+        # The axml, levl and MD5 chunks follow the audio data
+        parts = []
+        if self._axml_chunk_data:
+            parts += self._chunk_parts(b'axml', self._axml_chunk_data,
+                                       b' ' * (len(self._axml_chunk_data) & 1))
+        if self._levl_chunk_data:
+            parts += self._chunk_parts(b'levl', self._levl_chunk_data,
+                                       b' ' * (len(self._levl_chunk_data) & 1))
+        if self._md5_chunk_data:
+            parts += self._chunk_parts(b'MD5 ', self._md5_chunk_data)
+        return parts
 
     def _write_chna_chunk(self):
-        self._file.write(struct.pack('<4s', b'chna'))
-        self._file.write(struct.pack('<l', len(self._chna_chunk_data)))
-        self._file.write(self._chna_chunk_data)
+        self._write_chunk(b'chna', self._chna_chunk_data)
 
 
-def open(f, mode=None):
+def open(f, mode=None, *, patch_on_every_write=False):
     if mode is None:
         if hasattr(f, 'mode'):
             mode = f.mode
@@ -1184,7 +1340,7 @@ def open(f, mode=None):
     if mode in ('r', 'rb'):
         return Wave_read(f)
     elif mode in ('w', 'wb'):
-        return Wave_write(f)
+        return Wave_write(f, patch_on_every_write)
     else:
         raise Error("mode must be 'r', 'rb', 'w', or 'wb'")
 
@@ -0,0 +1,128 @@
+import io
+
+import pytest
+
+import wave_bwf_rf64
+
+
+def test_bext_round_trip(bext_wavefile):
+    assert bext_wavefile.read_bext(), "did not find bext chunk?"
+
+    assert bext_wavefile.get_bext_description().rstrip(b'\x00') == b'Description'
+    assert bext_wavefile.get_bext_originator().rstrip(b'\x00') == b'Originator'
+    assert bext_wavefile.get_bext_originator_reference().rstrip(b'\x00') == b'Reference'
+    assert bext_wavefile.get_bext_origination_date() == [2023, 9, 28]
+    assert bext_wavefile.get_bext_origination_time() == [13, 37, 42]
+    assert bext_wavefile.get_bext_time_reference() == [48000, 0]
+    assert bext_wavefile.get_bext_umid() == [bytes([i]) for i in range(64)]
+    assert bext_wavefile.get_bext_version() == 2
+    assert bext_wavefile.get_bext_loudness_value() == -23.0
+    assert bext_wavefile.get_bext_max_true_peak_level() == -1.5
+    assert bext_wavefile.get_bext_loudness_range() is None
+    assert bext_wavefile.get_bext_coding_history() == b'A=PCM,F=48000,W=16,M=stereo,T=wave_bwf_levl_RF64.py-1.0.6\r\n\x00'
+
+
+def test_bext_chunk_layout(bext_wavefile):
+    chunk = bext_wavefile.get_bext_chunk()
+    # 602 bytes of fixed fields followed by the coding history
+    assert len(chunk) == 602 + len(bext_wavefile.get_bext_coding_history())
+    assert chunk[320:338] == b'2023-09-2813-37-42'
+
+
+@pytest.mark.parametrize("nchannels, mode", [(1, b'mono'), (2, b'stereo'), (6, b'6')])
+def test_generate_coding_history(nchannels, mode):
+    bext = wave_bwf_rf64.wave.Bext()
+    bext.generate_coding_history(44100, 3, nchannels)
+    coding_history = bext._coding_history.rstrip(b'\x00')
+    assert coding_history == b'A=PCM,F=44100,W=24,M=' + mode + b',T=wave_bwf_levl_RF64.py-1.0.6\r\n'
+    assert len(bext._coding_history) % 2 == 0
+
+
+def test_loudness_scaling_without_instance():
+    values = [-23.0, 0.0, 99.994, -100.0]
+    scaled = list(map(wave_bwf_rf64.wave.Bext.scaleup, values))
+    assert scaled == [-2300, 0, 9999, 0x7fff]
+    assert list(map(wave_bwf_rf64.wave.Bext.scaledown, scaled)) == [-23.0, 0.0, 99.99, None]
+
+
+def test_loudness_set_after_bext_is_patched():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((1, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.set_bext_description(b'')
+    writer.set_bext_originator(b'')
+    writer.set_bext_originator_reference(b'')
+    writer.set_bext_loudness_value(-23.0)
+    writer.set_bext()
+    writer.writeframes(b'\x00\x00' * 480)
+    writer.set_bext_loudness_value(-18.0)
+    writer.close()
+
+    buffer.seek(0)
+    reader = wave_bwf_rf64.open(buffer, "rb")
+    reader.read_bext()
+    assert reader.get_bext_loudness_value() == -18.0
+    reader.close()
+
+
+def test_loudness_set_with_set_bext_after_writeframes_is_patched():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((1, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.set_bext_description(b'')
+    writer.set_bext_originator(b'')
+    writer.set_bext_originator_reference(b'')
+    writer.set_bext_loudness_value(-99.0)
+    writer.set_bext()
+    writer.writeframes(b'\x00\x00' * 480)
+    writer.set_bext_loudness_value(-18.0)
+    writer.set_bext()
+    writer.close()
+
+    buffer.seek(0)
+    reader = wave_bwf_rf64.open(buffer, "rb")
+    reader.read_bext()
+    assert reader.get_bext_loudness_value() == -18.0
+    reader.close()
+
+
+def test_copied_bext_loudness_is_kept(bext_wavefile):
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.copy_bext(bext_wavefile.get_bext_chunk())
+    writer.writeframes(b'\x00\x00' * 2 * 480)
+    writer.close()
+
+    buffer.seek(0)
+    reader = wave_bwf_rf64.open(buffer, "rb")
+    reader.read_bext()
+    assert reader.get_bext_loudness_value() == -23.0
+    assert reader.get_bext_max_true_peak_level() == -1.5
+    reader.close()
+
+
+@pytest.fixture
+def bext_wavefile():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 480, 'NONE', 'not compressed'))
+    writer.set_bext_description(b'Description')
+    writer.set_bext_originator(b'Originator')
+    writer.set_bext_originator_reference(b'Reference')
+    writer.set_bext_origination_date([2023, 9, 28])
+    writer.set_bext_origination_time([13, 37, 42])
+    writer.set_bext_time_reference([48000, 0])
+    writer.set_bext_umid([bytes([i]) for i in range(64)])
+    writer.set_bext_loudness_value(-23.0)
+    writer.set_bext_max_true_peak_level(-1.5)
+    writer.set_bext()
+    writer.writeframes(b'\x00\x00' * 2 * 480)
+    writer.close()
+
+    buffer.seek(0)
+    wavefile = wave_bwf_rf64.open(buffer, "rb")
+    try:
+        yield wavefile
+    finally:
+        wavefile.close()
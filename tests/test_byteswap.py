@@ -0,0 +1,23 @@
+import pytest
+
+from wave_bwf_rf64.wave import _byteswap, _byteswap_into
+
+
+@pytest.mark.parametrize("sampwidth, data, expected", [
+    (2, b'\x01\x02\x03\x04', b'\x02\x01\x04\x03'),
+    (3, b'\x01\x02\x03\x04\x05\x06', b'\x03\x02\x01\x06\x05\x04'),
+    (4, b'\x01\x02\x03\x04\x05\x06\x07\x08', b'\x04\x03\x02\x01\x08\x07\x06\x05'),
+])
+def test_byteswap(sampwidth, data, expected):
+    assert bytes(_byteswap(data, sampwidth)) == expected
+
+
+@pytest.mark.parametrize("sampwidth, data, expected", [
+    (2, b'\x01\x02\x03\x04', b'\x02\x01\x04\x03'),
+    (3, b'\x01\x02\x03\x04\x05\x06', b'\x03\x02\x01\x06\x05\x04'),
+    (4, b'\x01\x02\x03\x04\x05\x06\x07\x08', b'\x04\x03\x02\x01\x08\x07\x06\x05'),
+])
+def test_byteswap_into(sampwidth, data, expected):
+    buffer = bytearray(data)
+    _byteswap_into(buffer, sampwidth)
+    assert buffer == expected
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+
+import wave_bwf_rf64
+
+
+def test_chna_round_trip(chna_wavefile):
+    assert chna_wavefile.read_chna(), "did not find chna chunk?"
+
+    assert chna_wavefile.get_chna_num_tracks() == 2
+    assert chna_wavefile.get_chna_num_uids() == 3
+    assert chna_wavefile.get_chna_track(0) == [1, b'ATU_00000001', b'AT_00031001_01', b'AP_00031001']
+    assert chna_wavefile.get_chna_track(1) == [2, b'ATU_00000002', b'AT_00031002_01', b'AP_00031001']
+    assert chna_wavefile.get_chna_track(2) == [2, b'ATU_00000003', b'AT_00031002_02', b'AP_00031002']
+
+
+def test_chna_chunk_is_padded_to_32_entries():
+    chna = wave_bwf_rf64.wave.Chna()
+    chna.add_new_track(1, b'ATU_00000001', b'AT_00031001_01', b'AP_00031001')
+    chunk = chna.pack_chunk()
+    assert len(chunk) == 4 + 32 * 40
+    assert chunk[4:44] == b'\x01\x00ATU_00000001AT_00031001_01AP_00031001\x00'
+    assert chunk[44:] == bytes(31 * 40)
+
+
+@pytest.fixture
+def chna_wavefile():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 480, 'NONE', 'not compressed'))
+    writer.chna_add_new_track(1, b'ATU_00000001', b'AT_00031001_01', b'AP_00031001')
+    writer.chna_add_new_track(2, b'ATU_00000002', b'AT_00031002_01', b'AP_00031001')
+    writer.chna_add_existing_track(2, b'ATU_00000003', b'AT_00031002_02', b'AP_00031002')
+    writer.set_chna()
+    writer.writeframes(b'\x00\x00' * 2 * 480)
+    writer.close()
+
+    buffer.seek(0)
+    wavefile = wave_bwf_rf64.open(buffer, "rb")
+    try:
+        yield wavefile
+    finally:
+        wavefile.close()
@@ -0,0 +1,47 @@
+import pathlib
+
+import pytest
+
+import wave_bwf_rf64
+
+
+def test_readframesinto_matches_readframes(wavefile_path):
+    with_readframes = wave_bwf_rf64.open(str(wavefile_path), "rb")
+    with_readframesinto = wave_bwf_rf64.open(str(wavefile_path), "rb")
+    try:
+        framesize = with_readframes.getnchannels() * with_readframes.getsampwidth()
+        buffer = bytearray(4096 * framesize)
+        nframes_total = 0
+        while True:
+            expected = with_readframes.readframes(4096)
+            nframes = with_readframesinto.readframesinto(buffer)
+            assert buffer[:nframes * framesize] == expected
+            if not nframes:
+                break
+            nframes_total += nframes
+        assert nframes_total == with_readframes.getnframes()
+        assert with_readframesinto.tell() == with_readframes.tell()
+    finally:
+        with_readframes.close()
+        with_readframesinto.close()
+
+
+def test_readframesinto_after_setpos(wavefile_path):
+    wavefile = wave_bwf_rf64.open(str(wavefile_path), "rb")
+    try:
+        framesize = wavefile.getnchannels() * wavefile.getsampwidth()
+        wavefile.setpos(1000)
+        expected = wavefile.readframes(10)
+        wavefile.setpos(1000)
+        # Room for ten and a half frames, of which only the whole frames are filled
+        buffer = bytearray(10 * framesize + framesize // 2)
+        assert wavefile.readframesinto(buffer) == 10
+        assert buffer[:10 * framesize] == expected
+        assert wavefile.tell() == 1010
+    finally:
+        wavefile.close()
+
+
+@pytest.fixture
+def wavefile_path():
+    return pathlib.Path(__file__).parent / 'markers.wav'
@@ -0,0 +1,202 @@
+import array
+import io
+import struct
+
+import pytest
+
+import wave_bwf_rf64
+
+
+def test_written_frames_can_be_read_back(written_file):
+    frames = bytes(range(256)) * 4
+    wavefile = wave_bwf_rf64.open(io.BytesIO(written_file(frames)), "rb")
+    try:
+        assert wavefile.getparams() == (2, 2, 48000, 256, 'NONE', 'not compressed')
+        assert wavefile.readframes(256) == frames
+    finally:
+        wavefile.close()
+
+
+def test_header_sizes_are_patched(written_file):
+    frames = bytes(range(256)) * 4
+    data = written_file(frames, axml=b'<axml/>')
+    riff_id, riff_size, wave_id = struct.unpack_from('<4sL4s', data)
+    assert (riff_id, wave_id) == (b'RIFF', b'WAVE')
+    assert riff_size == len(data) - 8
+    data_start = data.index(b'data')
+    assert struct.unpack_from('<l', data, data_start + 4)[0] == len(frames)
+    # The trailing chunk is padded to an even size
+    assert data.endswith(b'axml\x08\x00\x00\x00<axml/> ')
+
+
+@pytest.mark.parametrize("patch_on_every_write, expected_data_size", [(False, 4), (True, 64)])
+def test_patch_on_every_write(patch_on_every_write, expected_data_size):
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.wave.Wave_write(buffer, patch_on_every_write=patch_on_every_write)
+    # Announce a single frame, so the header is only right once patched
+    writer.setparams((2, 2, 48000, 1, 'NONE', 'not compressed'))
+    writer.writeframes(bytes(64))
+    data_start = buffer.getvalue().index(b'data')
+    assert struct.unpack_from('<l', buffer.getvalue(), data_start + 4)[0] == expected_data_size
+    writer.close()
+    assert struct.unpack_from('<l', buffer.getvalue(), data_start + 4)[0] == 64
+
+
+def test_open_forwards_patch_on_every_write():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb", patch_on_every_write=True)
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.writeframes(bytes(64))
+    writer.writeframes(bytes(64))
+    data_start = buffer.getvalue().index(b'data')
+    assert struct.unpack_from('<l', buffer.getvalue(), data_start + 4)[0] == 128
+    writer.close()
+
+
+def test_set_md5_leaves_the_callers_data_alone():
+    digest = bytearray(b'0123456789abcde')
+    writer = wave_bwf_rf64.open(io.BytesIO(), "wb")
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.set_md5(digest)
+    assert digest == b'0123456789abcde'
+    writer.close()
+
+
+def test_riff_size_follows_axml_changed_after_set_axml():
+    buffer = io.BytesIO()
+    axml = bytearray(b'<axml/>')
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.set_axml(axml)
+    axml += b'<more/>'
+    writer.writeframes(bytes(64))
+    writer.close()
+    data = buffer.getvalue()
+    assert struct.unpack_from('<l', data, 4)[0] == len(data) - 8
+    assert data.endswith(b'axml\x0e\x00\x00\x00<axml/><more/>')
+
+
+def test_number_of_frames_need_not_be_set():
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.writeframes(bytes(64))
+    writer.close()
+
+    wavefile = wave_bwf_rf64.open(io.BytesIO(buffer.getvalue()), "rb")
+    try:
+        assert wavefile.getnframes() == 16
+    finally:
+        wavefile.close()
+
+
+@pytest.mark.parametrize("setter, args", [
+    ('setnchannels', (1,)),
+    ('setsampwidth', (3,)),
+    ('setframerate', (44100,)),
+    ('setnframes', (10,)),
+    ('setcomptype', ('NONE', 'not compressed')),
+    ('setparams', ((2, 2, 48000, 0, 'NONE', 'not compressed'),)),
+])
+def test_parameters_are_fixed_once_the_header_is_written(setter, args):
+    writer = wave_bwf_rf64.open(io.BytesIO(), "wb")
+    writer.setparams((2, 2, 48000, 0, 'NONE', 'not compressed'))
+    writer.writeframes(b'')
+    with pytest.raises(wave_bwf_rf64.wave.Error):
+        getattr(writer, setter)(*args)
+    writer.close()
+
+
+@pytest.mark.parametrize("params", [
+    (0, 2, 48000, 0, 'NONE', 'not compressed'),
+    (2, 5, 48000, 0, 'NONE', 'not compressed'),
+    (2, 2, 0, 0, 'NONE', 'not compressed'),
+    (2, 2, 48000, 0, 'ULAW', 'CCITT G.711 u-law'),
+])
+def test_setparams_rejects_bad_params_without_changing_any(params):
+    writer = wave_bwf_rf64.open(io.BytesIO(), "wb")
+    writer.setparams((1, 3, 44100, 10, 'NONE', 'not compressed'))
+    with pytest.raises(wave_bwf_rf64.wave.Error):
+        writer.setparams(params)
+    assert writer.getparams()[:4] == (1, 3, 44100, 10)
+    writer.close()
+
+
+def test_writeframes_accepts_any_buffer():
+    samples = array.array('h', range(-256, 256))
+    buffer = io.BytesIO()
+    writer = wave_bwf_rf64.open(buffer, "wb")
+    writer.setparams((2, 2, 48000, 256, 'NONE', 'not compressed'))
+    writer.writeframes(samples)
+    assert writer.getnframes() == 256
+    writer.close()
+
+    wavefile = wave_bwf_rf64.open(io.BytesIO(buffer.getvalue()), "rb")
+    try:
+        assert wavefile.readframes(256) == samples.tobytes()
+    finally:
+        wavefile.close()
+
+
+def test_file_on_disk_matches_file_in_memory(tmp_path, written_file):
+    frames = bytes(range(256)) * 4
+    path = tmp_path / 'on_disk.wav'
+    writer = wave_bwf_rf64.open(str(path), "wb")
+    writer.setparams((2, 2, 48000, 256, 'NONE', 'not compressed'))
+    writer.set_axml(b'<axml/>')
+    block_size = len(frames) // 4
+    for start in range(0, len(frames), block_size):
+        writer.writeframes(frames[start:start + block_size])
+    writer.close()
+    assert path.read_bytes() == written_file(frames, axml=b'<axml/>')
+
+
+def test_unbuffered_file_is_buffered_and_left_open(tmp_path):
+    frames = bytes(range(256)) * 4
+    with open(tmp_path / 'unbuffered.wav', 'wb', buffering=0) as raw_file:
+        writer = wave_bwf_rf64.open(raw_file, "wb")
+        writer.setparams((2, 2, 48000, 256, 'NONE', 'not compressed'))
+        writer.writeframes(frames)
+        writer.close()
+        assert not raw_file.closed
+
+    wavefile = wave_bwf_rf64.open(str(tmp_path / 'unbuffered.wav'), "rb")
+    try:
+        assert wavefile.readframes(256) == frames
+    finally:
+        wavefile.close()
+
+
+def test_trailing_chunks_on_disk_leave_file_at_end(tmp_path):
+    def write(file):
+        writer = wave_bwf_rf64.open(file, "wb")
+        writer.setparams((2, 2, 48000, 256, 'NONE', 'not compressed'))
+        writer.set_axml(b'<odd/>')
+        writer.set_levl(b'levl' * 100000)
+        writer.set_md5(b'0123456789abcdef')
+        writer.writeframes(bytes(range(256)) * 4)
+        writer.close()
+
+    buffer = io.BytesIO()
+    write(buffer)
+    with open(tmp_path / 'trailing.wav', 'wb') as file:
+        write(file)
+        assert file.tell() == len(buffer.getvalue())
+    assert (tmp_path / 'trailing.wav').read_bytes() == buffer.getvalue()
+
+
+@pytest.fixture
+def written_file():
+    def write(frames, axml=None):
+        buffer = io.BytesIO()
+        writer = wave_bwf_rf64.open(buffer, "wb")
+        writer.setparams((2, 2, 48000, 256, 'NONE', 'not compressed'))
+        if axml is not None:
+            writer.set_axml(axml)
+        block_size = len(frames) // 4
+        for start in range(0, len(frames), block_size):
+            writer.writeframes(frames[start:start + block_size])
+        writer.close()
+        return buffer.getvalue()
+    return write
+